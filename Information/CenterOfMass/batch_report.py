@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""Mass properties of all FreeCAD documents of a directory, without GUI.
+
+Runs with FreeCADCmd, e.g.:
+
+    FreeCADCmd CenterOfMass/batch_report.py --pass DIRECTORY --output report.csv
+    FreeCADCmd CenterOfMass/batch_report.py --pass DIRECTORY --densities bom.csv --workers 8
+
+The visible solids and meshes of every document are evaluated with the
+functions of CenterOfMass.FCMacro. The density of a solid is taken from
+the mapping given with --densities (matched by label), else from the
+material saved on the object by the macro or from the material of its
+shape, else the default density.
+A mapping is a CSV file with a "Label" column and a "Density" or
+"Material" column, or a JSON object label -> density or material name.
+The report has one row per solid and one total row per document (CSV),
+or one entry per document (JSON, if the output ends with .json).
+Lengths are in mm, masses in kg, moments of inertia in kg*mm^2.
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+
+import FreeCAD as app
+import numpy as np
+import Part
+from FreeCAD import Units
+
+MACRO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'CenterOfMass.FCMacro')
+AXES = ('x', 'y', 'z')
+FIELDS = (['file', 'label', 'material', 'density_kg_m3', 'volume_mm3', 'area_mm2', 'mass_kg']
+          + ['com_' + a for a in AXES]
+          + ['I' + a + b for a in AXES for b in AXES])
+# types of objects whose shape is made of the shapes of other objects
+CONTAINER_TYPES = ('App::Part', 'App::DocumentObjectGroup', 'App::Origin',
+                   'Assembly::AssemblyObject', 'Assembly::JointGroup')
+
+# set by main() before the worker processes are forked
+g_com = None        # the module CenterOfMass.FCMacro
+g_mapping = {}      # label -> density or material name
+g_materials = {}    # material name -> density
+g_default = None    # default density
+
+
+def load_center_of_mass(path=MACRO_PATH):
+    """Return CenterOfMass.FCMacro as the module 'CenterOfMass'."""
+    # the .FCMacro extension is not known to importlib, hence the explicit loader
+    spec = importlib.util.spec_from_file_location('CenterOfMass', path,
+                                                  loader=SourceFileLoader('CenterOfMass', path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_mapping(path):
+    """Return the mapping label -> density or material name of a CSV or JSON file."""
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            return {str(k): str(v) for k, v in json.load(f).items()}
+    mapping = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        dialect = csv.Sniffer().sniff(sample, delimiters='\t;,')
+        reader = csv.DictReader(f, dialect=dialect, skipinitialspace=True)
+        col = {}
+        for name in ['label', 'material', 'densit']:
+            col[name] = next((s for s in reader.fieldnames if name in s.lower()), None)
+        if not col['label'] or not (col['material'] or col['densit']):
+            raise ValueError(f'{path}: a "Label" and a "Density" or "Material" column are needed')
+        for row in reader:
+            # material takes precedence over density
+            value = (col['material'] and row[col['material']]) or (col['densit'] and row[col['densit']])
+            if value:
+                mapping[row[col['label']]] = value
+    return mapping
+
+
+def density_of(obj):
+    """Return the material name and the density (Quantity) of obj."""
+    value = g_mapping.get(obj.Label)
+    if value:
+        if value in g_materials:
+            return value, g_materials[value]
+        if g_com.valid_density_string(value):
+            return 'custom', Units.Quantity(value)
+        app.Console.PrintWarning(f'{obj.Label}: no material or density "{value}"\n')
+    if hasattr(obj, 'Mat_Density'):
+        # saved by the macro
+        return getattr(obj, 'Mat_Name', 'custom'), Units.Quantity(obj.Mat_Density)
+    material = g_com.SolidsItem.get_object_material(obj)
+    if material and material.Name in g_materials:
+        return material.Name, g_materials[material.Name]
+    return 'default', g_default
+
+
+def document_solids(doc):
+    """Return the visible objects of doc with a volume, PartDesign bodies instead of their features."""
+    solids = []
+    for obj in doc.Objects:
+        if obj.TypeId in CONTAINER_TYPES or not getattr(obj, 'Visibility', False):
+            continue
+        parent = obj.getParentGeoFeatureGroup() if hasattr(obj, 'getParentGeoFeatureGroup') else None
+        if parent is not None and parent.TypeId == 'PartDesign::Body':
+            continue
+        if hasattr(obj, 'Shape') and not obj.Shape.isNull() and obj.Shape.Volume:
+            solids.append(obj)
+        elif hasattr(obj, 'Mesh') and obj.Mesh.Volume:
+            solids.append(obj)
+    return solids
+
+
+def placed_shape(obj):
+    """Return the shape or mesh of obj in global coordinates."""
+    if not hasattr(obj, 'Shape'):
+        return obj.Mesh
+    shape = Part.getShape(obj)
+    if callable(getattr(obj, 'getGlobalPlacement', None)):
+        shape.Placement = obj.getGlobalPlacement()
+    return shape
+
+
+def process_document(path):
+    """Return the mass properties of the solids of the document at path and their total."""
+    result = {'file': path, 'parts': []}
+    try:
+        doc = app.openDocument(path)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+    try:
+        parts = []
+        for obj in document_solids(doc):
+            volume, area, CoM, inertia = g_com.mass_properties(placed_shape(obj))
+            material, density = density_of(obj)
+            density_kg_mm3 = density.getValueAs('kg/mm^3').Value
+            mass = volume * density_kg_mm3
+            if inertia is None:
+                app.Console.PrintWarning(f'{path}: {obj.Label} has no "MatrixOfInertia"\n')
+                inertia = np.zeros((3, 3))
+            inertia = inertia * density_kg_mm3
+            parts.append((mass, CoM, inertia))
+            result['parts'].append(row_of(path, obj.Label, material, density_kg_mm3 * 1e9,
+                                          volume, area, mass, CoM, inertia))
+        massTot, TotalCoM, TotalMoI = g_com.total_mass_properties(parts)
+        volTot = sum(p['volume_mm3'] for p in result['parts'])
+        areaTot = sum(p['area_mm2'] for p in result['parts'])
+        densTot = massTot / volTot * 1e9 if volTot else 0.
+        result['total'] = row_of(path, 'Total', '', densTot,
+                                 volTot, areaTot, massTot, TotalCoM, TotalMoI)
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        app.closeDocument(doc.Name)
+    return result
+
+
+def row_of(path, label, material, density, volume, area, mass, CoM, inertia):
+    row = {'file': path, 'label': label, 'material': material, 'density_kg_m3': density,
+           'volume_mm3': volume, 'area_mm2': area, 'mass_kg': mass}
+    for i, a in enumerate(AXES):
+        row['com_' + a] = CoM[i]
+        for j, b in enumerate(AXES):
+            row['I' + a + b] = float(inertia[i][j])
+    return row
+
+
+def find_documents(directory, recursive=False):
+    if not recursive:
+        return sorted(os.path.join(directory, f) for f in os.listdir(directory)
+                      if f.lower().endswith('.fcstd'))
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, f) for f in files if f.lower().endswith('.fcstd'))
+    return sorted(paths)
+
+
+def run(paths, workers=1):
+    """Return the results of process_document() for paths, in the same order."""
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [process_document(path) for path in paths]
+    # fork: the workers inherit the loaded macro, the mapping and the materials
+    with multiprocessing.get_context('fork').Pool(workers) as pool:
+        return pool.map(process_document, paths, chunksize=1)
+
+
+def write_report(results, output):
+    if output.lower().endswith('.json'):
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1)
+        return
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerows(result['parts'])
+            if 'total' in result:
+                writer.writerow(result['total'])
+
+
+def script_args():
+    """Return the arguments following this script on the command line."""
+    argv = sys.argv
+    for i, arg in enumerate(argv):
+        if arg.endswith('batch_report.py'):
+            argv = argv[i + 1:]
+            break
+    return [a for a in argv if a != '--pass']
+
+
+def main():
+    global g_com, g_mapping, g_materials, g_default
+    parser = argparse.ArgumentParser(description='Mass properties of FreeCAD documents')
+    parser.add_argument('directory', help='directory of the FCStd files')
+    parser.add_argument('--output', default='mass_report.csv',
+                        help='report file, JSON if ending with .json, else CSV')
+    parser.add_argument('--densities', help='CSV or JSON file mapping labels to densities or materials')
+    parser.add_argument('--default', help='default density, e.g. "7850 kg/m^3"')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(),
+                        help='number of worker processes')
+    parser.add_argument('--recursive', action='store_true', help='include subdirectories')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to CenterOfMass.FCMacro')
+    args = parser.parse_args(script_args())
+
+    g_com = load_center_of_mass(args.macro)
+    g_default = Units.Quantity(args.default or g_com.DEFAULT_DENSITY)
+    g_materials = g_com.read_material_cards()
+    if args.densities:
+        g_mapping = read_mapping(args.densities)
+
+    paths = find_documents(args.directory, args.recursive)
+    results = run(paths, args.workers)
+    for result in results:
+        if 'error' in result:
+            app.Console.PrintWarning('{}: {}\n'.format(result['file'], result['error']))
+    write_report(results, args.output)
+    app.Console.PrintMessage('{} documents evaluated, written to {}\n'.format(
+        len(results), args.output))
+
+
+if __name__ == '__main__':
+    main()
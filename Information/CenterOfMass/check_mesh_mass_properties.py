@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Check of mesh_mass_properties() of CenterOfMass.FCMacro, without FreeCAD.
+
+Runs with any Python that has NumPy, e.g.:
+
+    python3 CenterOfMass/check_mesh_mass_properties.py
+
+The function is taken from the source of the macro and run on closed
+meshes with a stand-in for FreeCAD.Vector. Volume and center of mass are
+compared with the former facet by facet loop, the inertia tensor with the
+analytic values of an offset box and of a tetrahedron. Exits with status 1
+if a value differs.
+"""
+
+import ast
+import math
+import os
+import sys
+
+import numpy as np
+
+MACRO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'CenterOfMass.FCMacro')
+TOLERANCE = 1e-9
+
+
+class Vector(tuple):
+    """Stand-in for FreeCAD.Vector"""
+
+    def __new__(cls, x, y, z):
+        return super().__new__(cls, (float(x), float(y), float(z)))
+
+
+class Mesh:
+    """Stand-in for Mesh.Mesh, with the facets as vertex indices"""
+
+    def __init__(self, points, facets):
+        self.Topology = ([Vector(*p) for p in points], [tuple(f) for f in facets])
+
+
+def load_mesh_mass_properties(path=MACRO_PATH):
+    """Return mesh_mass_properties() compiled from the source of the macro"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    functions = [node for node in tree.body
+                 if isinstance(node, ast.FunctionDef) and node.name == 'mesh_mass_properties']
+    namespace = {'np': np, 'app': type('app', (), {'Vector': Vector})}
+    exec(compile(ast.Module(body=functions, type_ignores=[]), path, 'exec'), namespace)
+    return namespace['mesh_mass_properties']
+
+
+def facet_loop(mesh):
+    """Volume and center of mass summed facet by facet, as former versions of the macro"""
+    points, facets = mesh.Topology
+    volume = 0.
+    _CoM = [0, 0, 0]
+    for facet in facets:
+        p = [points[i] for i in facet]
+        currentVolume = (p[0][0]*p[1][1]*p[2][2]
+                         - p[0][0]*p[2][1]*p[1][2]
+                         - p[1][0]*p[0][1]*p[2][2]
+                         + p[1][0]*p[2][1]*p[0][2]
+                         + p[2][0]*p[0][1]*p[1][2]
+                         - p[2][0]*p[1][1]*p[0][2]) / 6.
+        volume += currentVolume
+        for ax in range(3):
+            _CoM[ax] += ((p[0][ax] + p[1][ax] + p[2][ax]) / 4.) * currentVolume
+    return volume, [c / volume for c in _CoM]
+
+
+def box(origin, size):
+    """Closed mesh of a box, facets oriented outwards"""
+    points = [[origin[ax] + size[ax] * (i >> ax & 1) for ax in range(3)] for i in range(8)]
+    quads = ((0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5))
+    facets = [t for a, b, c, d in quads for t in ((a, b, c), (a, c, d))]
+    return Mesh(points, facets)
+
+
+def tetrahedron(origin, size):
+    """Closed mesh of the corner tetrahedron with edges of length size along the axes"""
+    points = [origin] + [[origin[ax] + size * (ax == i) for ax in range(3)] for i in range(3)]
+    return Mesh(points, [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])
+
+
+def prism(origin, radius, height, sides):
+    """Closed mesh of a regular prism, to compare with the facet loop only"""
+    ring = [[origin[0] + radius * math.cos(2 * math.pi * i / sides),
+             origin[1] + radius * math.sin(2 * math.pi * i / sides)] for i in range(sides)]
+    points = [p + [origin[2]] for p in ring] + [p + [origin[2] + height] for p in ring]
+    facets = []
+    for i in range(sides):
+        j = (i + 1) % sides
+        facets += [(i, j, sides + j), (i, sides + j, sides + i)]
+    for i in range(1, sides - 1):
+        facets += [(0, i + 1, i), (sides, sides + i, sides + i + 1)]
+    return Mesh(points, facets)
+
+
+def compare(name, value, expected):
+    error = float(np.max(np.abs(np.asarray(value, dtype=float) - np.asarray(expected, dtype=float))))
+    ok = error <= TOLERANCE * max(1., float(np.max(np.abs(expected))))
+    print('{:50} {} (error {:.3g})'.format(name, 'ok' if ok else 'FAILED', error))
+    return ok
+
+
+def main():
+    mesh_mass_properties = load_mesh_mass_properties()
+    ok = True
+
+    # box 2 x 3 x 4 at (1, 2, 3): I = V (b^2 + c^2) / 12 about the center
+    meshes = {
+        'offset box': (box((1, 2, 3), (2, 3, 4)), 24., (2., 3.5, 5.), np.diag((50., 40., 26.))),
+    }
+    # corner tetrahedron of edge s: V = s^3/6, CoM at s/4, Ixx = s^5/80, Ixy = s^5/480
+    s = 2.
+    tensor = s**5 * (np.full((3, 3), 1. / 480) + np.eye(3) * (1. / 80 - 1. / 480))
+    meshes['offset tetrahedron'] = (tetrahedron((10., -5., 3.), s), s**3 / 6,
+                                    (10.5, -4.5, 3.5), tensor)
+    meshes['prism'] = (prism((-20., 7., 1.), 5., 12., 64), None, None, None)
+
+    for name, (mesh, volume, center, inertia) in meshes.items():
+        result = mesh_mass_properties(mesh)
+        loopVolume, loopCenter = facet_loop(mesh)
+        ok &= compare(name + ': volume / facet loop', result[0], loopVolume)
+        ok &= compare(name + ': center of mass / facet loop', result[1], loopCenter)
+        if volume is not None:
+            ok &= compare(name + ': volume', result[0], volume)
+            ok &= compare(name + ': center of mass', result[1], center)
+            ok &= compare(name + ': inertia', result[2], inertia)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the selection helpers of CenterOfMass.FCMacro, without FreeCAD.
+
+Runs with any Python, e.g.:
+
+    python3 CenterOfMass/selection_benchmark.py --objects 10000 --group-size 1
+
+expand_groups() and part_children() are taken from the source of the macro
+and run on stand-in objects: half of the solids in groups of --group-size,
+the other half in an App::Part. They are timed against the former loops,
+which deleted list entries in place and compared each child shape with the
+whole OutList. Exits with status 1 if the results differ.
+"""
+
+import argparse
+import ast
+import collections
+import os
+import sys
+import time
+
+MACRO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'CenterOfMass.FCMacro')
+
+
+class Shape:
+    """Stand-in for Part.Shape, equal shapes have the same key"""
+
+    def __init__(self, key, children=()):
+        self.key = key
+        self.children = list(children)
+
+    def hashCode(self):
+        return hash(self.key)
+
+    def isEqual(self, other):
+        return self.key == other.key
+
+    def childShapes(self, cumulativePlacement, cumulativeAttributes):
+        return self.children
+
+
+class DocumentObject:
+    """Stand-in for App.DocumentObject"""
+
+    def __init__(self, label, typeId, shape=None, group=None):
+        self.Label = label
+        self.TypeId = typeId
+        self.OutList = []
+        if shape is not None:
+            self.Shape = shape
+        if group is not None:
+            self.Group = group
+            self.OutList = list(group)
+
+
+def load_selection_helpers(path=MACRO_PATH):
+    """Return expand_groups() and part_children() compiled from the source of the macro"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    functions = [node for node in tree.body if isinstance(node, ast.FunctionDef)
+                 and node.name in ('expand_groups', 'part_children')]
+    namespace = {'collections': collections}
+    exec(compile(ast.Module(body=functions, type_ignores=[]), path, 'exec'), namespace)
+    return namespace['expand_groups'], namespace['part_children']
+
+
+def former_expand_groups(sel):
+    """Group expansion of former versions of the macro"""
+    _sel = list(sel)
+    groupObjs = ('App::DocumentObjectGroup', 'App::GeometryPython', 'Assembly::AssemblyObject')
+    i_ = 0
+    while i_ < len(_sel):
+        if hasattr(_sel[i_], 'Group') and _sel[i_].TypeId in groupObjs:
+            _sel.extend(_sel[i_].Group)
+            del _sel[i_]
+        elif hasattr(_sel[i_], 'Group') and _sel[i_].TypeId == 'App::Part':
+            for gp in _sel[i_].Group:
+                if gp.TypeId == 'App::Part':
+                    _sel.append(gp)
+                elif gp.TypeId == 'Mesh::Feature':
+                    _sel.append(gp)
+            i_ += 1
+        else:
+            i_ += 1
+    return _sel
+
+
+def former_part_children(part):
+    """Matching of the child shapes of an App::Part of former versions of the macro"""
+    children = []
+    for cs in part.Shape.childShapes(False, False):
+        for ot in part.OutList:
+            if hasattr(ot, 'Shape') and ot.Shape.isEqual(cs):
+                children.append(ot)
+                break
+    return children
+
+
+def document(count, group_size):
+    """Return the selection of groups and an App::Part, count solids in total"""
+    solids = [DocumentObject('Solid{:05}'.format(i), 'Part::Feature', Shape(i))
+              for i in range(count)]
+    half = count // 2
+    groups = [DocumentObject('Group{:05}'.format(i), 'App::DocumentObjectGroup',
+                             group=solids[i:min(i + group_size, half)])
+              for i in range(0, half, group_size)]
+    members = solids[half:]
+    part = DocumentObject('Part', 'App::Part', Shape('part', [s.Shape for s in members]),
+                          group=members)
+    return groups + [part], part
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the selection helpers of CenterOfMass')
+    parser.add_argument('--objects', type=int, default=10000, help='number of solids')
+    parser.add_argument('--group-size', type=int, default=1,
+                        help='number of solids per group')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to CenterOfMass.FCMacro')
+    args = parser.parse_args()
+
+    expand_groups, part_children = load_selection_helpers(args.macro)
+    sel, part = document(args.objects, args.group_size)
+    ok = True
+    for name, function, former in (('expand_groups', expand_groups, former_expand_groups),
+                                   ('part_children', part_children, former_part_children)):
+        arg = sel if name == 'expand_groups' else part
+        t_new, result = timed(function, arg)
+        t_old, expected = timed(former, arg)
+        same = [o.Label for o in result] == [o.Label for o in expected]
+        ok &= same
+        print('{:15} {:9.1f} ms, former {:9.1f} ms {}'.format(
+            name, t_new * 1e3, t_old * 1e3, 'ok' if same else 'DIFFERENT'))
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
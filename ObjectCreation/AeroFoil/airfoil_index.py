@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Index of a directory of airfoil coordinates files, without GUI.
+
+Runs with FreeCADCmd, e.g.:
+
+    FreeCADCmd AeroFoil/airfoil_index.py --pass DIRECTORY
+    FreeCADCmd AeroFoil/airfoil_index.py --pass DIRECTORY --min-thickness 0.1 --output index.csv
+
+The name, number of points and maximum thickness (relative to the chord)
+of every Selig or Lednicer *.dat file of the directory are listed, sorted
+by file name or by thickness. The index is built with the airfoilIndex()
+function of AeroFoil.FCMacro, which stores it in the user data directory:
+only new or changed files are parsed again on the next run.
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import FreeCAD as app
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aerofoil_script import MACRO_PATH, load_aerofoil, script_args  # noqa: E402
+
+FIELDS = ('name', 'points', 'thickness', 'file')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index of airfoil coordinates files')
+    parser.add_argument('directory', help='directory of the *.dat files')
+    parser.add_argument('--min-thickness', type=float, default=0.0,
+                        help='minimum thickness relative to the chord')
+    parser.add_argument('--max-thickness', type=float, default=1.0,
+                        help='maximum thickness relative to the chord')
+    parser.add_argument('--sort', choices=('file', 'thickness'), default='file',
+                        help='sort order of the list')
+    parser.add_argument('--output', help='CSV file for the list, else printed')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to AeroFoil.FCMacro')
+    args = parser.parse_args(script_args(__file__))
+
+    af = load_aerofoil(args.macro)
+    entries = [e for e in af.airfoilIndex(args.directory)
+               if e['points'] and args.min_thickness <= e['thickness'] <= args.max_thickness]
+    if args.sort == 'thickness':
+        entries.sort(key=lambda e: e['thickness'])
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(entries)
+    else:
+        for e in entries:
+            app.Console.PrintMessage('{name:30.30} {points:5} {thickness:7.2%}  {file}\n'.format(**e))
+    app.Console.PrintMessage('{} airfoils\n'.format(len(entries)))
+
+
+if __name__ == '__main__':
+    main()
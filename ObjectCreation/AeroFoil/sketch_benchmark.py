@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the sketch construction modes of AeroFoil.
+
+Runs without GUI, e.g.:
+
+    FreeCADCmd AeroFoil/sketch_benchmark.py --pass --points 50,200,400
+    FreeCADCmd AeroFoil/sketch_benchmark.py --pass --output result.json
+
+A NACA profile is created as a polyline and as a BSpline sketch with each
+construction mode: one call per geometry and constraint (incremental, the
+former path), all geometry and constraints at once with DistanceX/DistanceY
+constraints (bulk), and at once with Block constraints (block).
+The wall time, including the recompute, the number of constraints, the
+solver status and the length of the resulting shape are reported.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import FreeCAD as app
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aerofoil_script import MACRO_PATH, load_aerofoil, script_args  # noqa: E402
+
+# name -> (AeroFoil.sketchBulk, AeroFoil.sketchBlock)
+MODES = {
+    'incremental': (False, False),
+    'bulk': (True, False),
+    'block': (True, True),
+}
+CURVE_TYPES = {'polyline': 1, 'bspline': 2}
+
+
+class ProgressBar:
+    """Stand-in for the progress bar of the final dialog."""
+
+    def __init__(self):
+        self._value = 0
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+
+
+def dialog_data(af, airfoil_number, points, curve_type, chord=100.0):
+    """Return the data of AeroFoilDialog needed by the AeroFoil class."""
+    xu, yu, xl, yl = af.nacaPoints(airfoil_number, points)
+    points_x = [float(x) * chord for x in list(xu) + list(xl[::-1])]
+    points_y = [float(y) * chord for y in list(yu) + list(yl[::-1])]
+    # closed as in _prepareAeroFoil(): the first point is repeated only if
+    # the last one differs from it
+    if points_x[-1] != points_x[0] or points_y[-1] != points_y[0]:
+        points_x.append(points_x[0])
+        points_y.append(points_y[0])
+    return SimpleNamespace(
+        chordLength=chord, chordUnits=1, workbench=2, curveType=curve_type,
+        closed_=False, splitCurve=False, splitCurveMode=1, defaultEndPoints=False,
+        midIndex1=points - 1, midIndex2=points, pointsX=points_x, pointsY=points_y,
+        progressBar_=ProgressBar(), airfoilType=1, airfoil4DNumber=airfoil_number,
+        airfoil5DNumber='', airfoilProfileType=1, importFrom=1)
+
+
+def measure(af, data, mode):
+    profile = af.AeroFoil(data)
+    profile.sketchBulk, profile.sketchBlock = MODES[mode]
+    name = '_createSketcher' + ('PolyLine' if data.curveType == 1 else 'BSpline')
+    create = getattr(profile, name + 'Bulk' if profile.sketchBulk else name)
+    start = time.perf_counter()
+    create(profile.profileName, 0, len(data.pointsX) - 1)
+    af.doc.recompute()
+    elapsed = time.perf_counter() - start
+    sketch = af.doc.getObjectsByLabel(profile.profileName)[0]
+    result = {
+        'time': elapsed,
+        'geometry': len(sketch.Geometry),
+        'constraints': len(sketch.Constraints),
+        'solver': sketch.solve(),
+        'length': sketch.Shape.Length,
+    }
+    af.doc.removeObject(sketch.Name)
+    return result
+
+
+def run(af, points_list, airfoil_number='2412', modes=tuple(MODES), curve_types=tuple(CURVE_TYPES)):
+    """Return the list of measurements, one dict per curve type, number of points and mode."""
+    af.doc = app.newDocument('AeroFoilSketchBenchmark')
+    results = []
+    try:
+        for curve in curve_types:
+            for points in points_list:
+                data = dialog_data(af, airfoil_number, points, CURVE_TYPES[curve])
+                for mode in modes:
+                    result = {'curve': curve, 'points': len(data.pointsX), 'mode': mode}
+                    try:
+                        result.update(measure(af, data, mode))
+                    except Exception as e:
+                        result['error'] = str(e)
+                    results.append(result)
+    finally:
+        app.closeDocument(af.doc.Name)
+    return results
+
+
+def print_results(results):
+    for r in results:
+        if 'error' in r:
+            app.Console.PrintWarning('{curve:9} {points:5} {mode:12} error: {error}\n'.format(**r))
+            continue
+        app.Console.PrintMessage(
+            '{curve:9} {points:5} {mode:12} {time:8.3f} s {constraints:6} constraints'
+            ' solver {solver} length {length:.6f}\n'.format(**r))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the AeroFoil sketch construction')
+    parser.add_argument('--points', default='50,100,200',
+                        help='comma separated numbers of points per airfoil surface')
+    parser.add_argument('--naca', default='2412', help='NACA 4 or 5 digit airfoil code')
+    parser.add_argument('--modes', default=','.join(MODES), help='comma separated modes')
+    parser.add_argument('--curves', default=','.join(CURVE_TYPES),
+                        help='comma separated curve types')
+    parser.add_argument('--output', help='JSON file for the results')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to AeroFoil.FCMacro')
+    args = parser.parse_args(script_args(__file__))
+
+    af = load_aerofoil(args.macro)
+    results = run(af, [int(n) for n in args.points.split(',')], args.naca,
+                  args.modes.split(','), args.curves.split(','))
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Lofted wing from a spanwise table of sections, without GUI.
+
+Runs with FreeCADCmd, e.g.:
+
+    FreeCADCmd AeroFoil/wing_builder.py --pass wing.csv --output wing.FCStd
+    FreeCADCmd AeroFoil/wing_builder.py --pass wing.csv --output wing.step --points 80
+
+The table is a CSV file with the columns station (mm), chord (mm),
+twist (degrees) and airfoil (NACA 4 or 5 digit code, or the path of a
+Selig or Lednicer coordinates file relative to the table), optionally
+preceded by a header row with these names. The wing is built with the
+makeWing() function of AeroFoil.FCMacro and saved as a FreeCAD document,
+or exported if the output ends with .step, .stp, .brep or .iges.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import FreeCAD as app
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aerofoil_script import MACRO_PATH, load_aerofoil, script_args  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lofted wing from a table of sections')
+    parser.add_argument('table', help='CSV file of the sections')
+    parser.add_argument('--output', default='wing.FCStd',
+                        help='FreeCAD document, or STEP, BREP or IGES file')
+    parser.add_argument('--points', type=int, default=51,
+                        help='number of points per surface of the NACA sections')
+    parser.add_argument('--uniform', action='store_true',
+                        help='evenly spaced NACA points instead of cosine spacing')
+    parser.add_argument('--ruled', action='store_true', help='ruled surfaces between sections')
+    parser.add_argument('--name', default='Wing', help='name of the wing object')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to AeroFoil.FCMacro')
+    args = parser.parse_args(script_args(__file__))
+
+    af = load_aerofoil(args.macro)
+    sections = af.readWingTable(args.table)
+    document = app.newDocument('Wing')
+    start = time.perf_counter()
+    wing = af.makeWing(sections, args.name, args.points, not args.uniform, args.ruled, document)
+    elapsed = time.perf_counter() - start
+    extension = os.path.splitext(args.output)[1].lower()
+    if extension in ('.step', '.stp'):
+        wing.Shape.exportStep(args.output)
+    elif extension in ('.brep', '.brp'):
+        wing.Shape.exportBrep(args.output)
+    elif extension in ('.iges', '.igs'):
+        wing.Shape.exportIges(args.output)
+    else:
+        document.saveAs(args.output)
+    app.Console.PrintMessage('{} sections lofted in {:.3f} s, volume {:.1f} mm^3, written to {}\n'.format(
+        len(sections), elapsed, wing.Shape.Volume, args.output))
+    app.closeDocument(document.Name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of ScrewMaker over its standards, sizes and thread types.
+
+Runs without GUI, e.g.:
+
+    FreeCADCmd ScrewMaker/benchmark.py --pass --output result.json
+    FreeCADCmd ScrewMaker/benchmark.py --pass --compare baseline.json
+
+For every standard of the registry ScrewMaker.screwTypes, a sample of its
+diameters and each thread type, the fastener shape is built once with an
+empty thread cache. Wall time, number of faces and edges, size of the BREP
+string and memory are written as JSON. Each fastener is built in a forked
+process, whose peak resident memory starts at its size when forked: the
+increase of the peak is the memory taken by this fastener alone.
+With --compare, the results are compared to a stored run and the
+regressions are listed; the exit status is 1 if there are any.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+import FreeCAD as app
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from screwmaker_script import MACRO_PATH, load_screw_maker, script_args  # noqa: E402
+
+THREAD_TYPES = ('simple', 'symbol', 'real')
+
+
+def sample(values, count):
+    """Return count values spread over values, including first and last."""
+    values = list(values)
+    if len(values) <= count:
+        return values
+    step = (len(values) - 1) / (count - 1)
+    return [values[int(round(i * step))] for i in range(count)]
+
+
+def peak_rss_kb():
+    """Return the peak resident memory of this process in kB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run(sm, diameters_per_standard=3, thread_types=THREAD_TYPES, standards=None):
+    """Return the list of measurements, one dict per fastener.
+
+    Without fork, the fasteners are built in this process and 'memory_kb'
+    only shows the increases of the peak over the whole run.
+    """
+    screw = sm.Screw()
+    results = []
+    for st_text in sorted(standards or sm.screwTypes):
+        if sm.screwTypes[st_text].builder is None:
+            continue
+        for nd_text in sample(sm.validDiameters(st_text), diameters_per_standard):
+            lengths = sm.validLengths(st_text, nd_text)
+            if lengths:
+                nl_text = lengths[len(lengths) // 2]
+            elif sm.fastenerType(st_text) == 'Screw-Tap':
+                nl_text = '10'
+            else:
+                nl_text = '0'
+            for thread_type in thread_types:
+                results.append(measure_in_child(sm, screw, st_text, nd_text, nl_text, thread_type))
+    return results
+
+
+def measure_in_child(sm, screw, st_text, nd_text, nl_text, thread_type):
+    """Return the result of measure() run in a forked process."""
+    args = (sm, screw, st_text, nd_text, nl_text, thread_type)
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return measure(*args)
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=lambda: sender.send(measure(*args)))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = dict(zip(('standard', 'diameter', 'length', 'thread'), args[2:]),
+                      error='process ended unexpectedly')
+    process.join()
+    return result
+
+
+def measure(sm, screw, st_text, nd_text, nl_text, thread_type):
+    result = {
+        'standard': st_text,
+        'diameter': nd_text,
+        'length': nl_text,
+        'thread': thread_type,
+    }
+    sm.clearThreadCache()
+    peak_before = peak_rss_kb()
+    screw.setThreadType(thread_type)
+    start = time.perf_counter()
+    try:
+        shape = screw.makeScrewShape(st_text, nd_text, float(nl_text))
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+    result['time'] = time.perf_counter() - start
+    if shape is None:
+        result['error'] = 'no shape'
+        return result
+    result['faces'] = len(shape.Faces)
+    result['edges'] = len(shape.Edges)
+    result['brep_size'] = len(shape.exportBrepToString())
+    result['memory_kb'] = peak_rss_kb() - peak_before
+    return result
+
+
+def key_of(result):
+    return (result['standard'], result['diameter'], result['length'], result['thread'])
+
+
+def compare(results, baseline, time_tolerance=0.25, min_time=0.01):
+    """Return the list of regressions as strings.
+
+    A regression is a fastener that failed, got slower by more than
+    time_tolerance (relative, ignoring times below min_time) or changed its
+    number of faces.
+    """
+    previous = {key_of(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        name = '{} {}x{} {}'.format(*key_of(result))
+        old = previous.get(key_of(result))
+        if old is None:
+            continue
+        if 'error' in result:
+            if 'error' not in old:
+                regressions.append('{}: fails with {}'.format(name, result['error']))
+            continue
+        if 'error' in old:
+            continue
+        if ((result['time'] > min_time)
+                and (result['time'] > old['time'] * (1.0 + time_tolerance))):
+            regressions.append('{}: {:.3f} s instead of {:.3f} s'.format(
+                name, result['time'], old['time']))
+        if result['faces'] != old['faces']:
+            regressions.append('{}: {} faces instead of {}'.format(
+                name, result['faces'], old['faces']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of ScrewMaker')
+    parser.add_argument('--output', default='screwmaker_benchmark.json',
+                        help='JSON file for the results')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='JSON file of a previous run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative increase of time considered a regression')
+    parser.add_argument('--diameters', type=int, default=3,
+                        help='number of diameters per standard')
+    parser.add_argument('--threads', default=','.join(THREAD_TYPES),
+                        help='comma separated thread types')
+    parser.add_argument('--standards', help='comma separated standards, default all')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to ScrewMaker.FCMacro')
+    args = parser.parse_args(script_args(__file__))
+
+    sm = load_screw_maker(args.macro)
+    standards = args.standards.split(',') if args.standards else None
+    results = run(sm, args.diameters, args.threads.split(','), standards)
+    with open(args.output, 'w') as f:
+        json.dump({'version': sm.__Version__,
+                   'freecad': app.Version()[:3],
+                   'results': results}, f, indent=1)
+    app.Console.PrintMessage('{} fasteners measured, written to {}\n'.format(
+        len(results), args.output))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            app.Console.PrintWarning(regression + '\n')
+        if regressions:
+            sys.exit(1)
+        app.Console.PrintMessage('No regression\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Helpers shared by the command line scripts of ScrewMaker.
+
+The scripts run with FreeCADCmd and import this module from their own
+directory, e.g.:
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from screwmaker_script import load_screw_maker, script_args
+"""
+
+import importlib.util
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+
+MACRO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'ScrewMaker.FCMacro')
+
+
+def load_screw_maker(path=MACRO_PATH):
+    """Return ScrewMaker.FCMacro as the module 'ScrewMaker'."""
+    # the .FCMacro extension is not known to importlib, hence the explicit loader
+    spec = importlib.util.spec_from_file_location('ScrewMaker', path,
+                                                  loader=SourceFileLoader('ScrewMaker', path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def script_args(script):
+    """Return the arguments following script on the command line, without '--pass'."""
+    name = os.path.basename(script)
+    argv = sys.argv
+    for i, arg in enumerate(argv):
+        if os.path.basename(arg) == name:
+            argv = argv[i + 1:]
+            break
+    return [a for a in argv if a != '--pass']
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Validation of the 'swept' thread against the 'real' thread of ScrewMaker.
+
+Runs without GUI, e.g.:
+
+    FreeCADCmd ScrewMaker/swept_validation.py --pass --output swept.json
+
+For every screw standard of the registry ScrewMaker.screwTypes that has
+the 'swept' thread, all its diameters and the shortest, middle and longest
+length (even and odd numbers of half turns), the fastener is built with
+both thread types and compared with Screw.compareSweptThread(). The
+relative differences of volume and area and the face counts are written
+as JSON and the worst cases are listed. The exit status is 1 if a case
+fails or differs more than the tolerance.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import FreeCAD as app
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from screwmaker_script import MACRO_PATH, load_screw_maker, script_args  # noqa: E402
+
+
+def cases(sm, standards=None):
+    """Yield (standard, diameter, length) of the screws with swept thread."""
+    for st_text in sorted(standards or sm.screwTypes):
+        if sm.screwTypes[st_text].builder is None:
+            continue
+        if (sm.fastenerType(st_text) != 'Screw'
+                or 'swept' not in sm.validThreadTypes(st_text)):
+            continue
+        for nd_text in sm.validDiameters(st_text):
+            lengths = sm.validLengths(st_text, nd_text)
+            if not lengths:
+                continue
+            for nl_text in sorted(set((lengths[0], lengths[len(lengths) // 2], lengths[-1])),
+                                  key=lengths.index):
+                yield st_text, nd_text, nl_text
+
+
+def run(sm, tolerance=0.01, standards=None):
+    """Return the list of comparisons, one dict per case."""
+    screw = sm.Screw()
+    results = []
+    for st_text, nd_text, nl_text in cases(sm, standards):
+        result = {'standard': st_text, 'diameter': nd_text, 'length': nl_text}
+        sm.clearThreadCache()
+        try:
+            ok, d_volume, d_area, faces_real, faces_swept = screw.compareSweptThread(
+                st_text, nd_text, nl_text, tolerance)
+        except Exception as e:
+            result['error'] = str(e)
+        else:
+            result.update(ok=ok, volume=d_volume, area=d_area,
+                          faces_real=faces_real, faces_swept=faces_swept)
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validation of ScrewMaker's swept thread")
+    parser.add_argument('--output', default='swept_validation.json',
+                        help='JSON file for the results')
+    parser.add_argument('--tolerance', type=float, default=0.01,
+                        help='relative difference of volume, area and size allowed')
+    parser.add_argument('--standards', help='comma separated standards, default all')
+    parser.add_argument('--worst', type=int, default=10,
+                        help='number of largest differences listed')
+    parser.add_argument('--macro', default=MACRO_PATH, help='path to ScrewMaker.FCMacro')
+    args = parser.parse_args(script_args(__file__))
+
+    sm = load_screw_maker(args.macro)
+    standards = args.standards.split(',') if args.standards else None
+    results = run(sm, args.tolerance, standards)
+    with open(args.output, 'w') as f:
+        json.dump({'version': sm.__Version__,
+                   'freecad': app.Version()[:3],
+                   'tolerance': args.tolerance,
+                   'results': results}, f, indent=1)
+
+    compared = [r for r in results if 'error' not in r]
+    failed = [r for r in results if not r.get('ok')]
+    for result in sorted(compared, key=lambda r: max(r['volume'], r['area']),
+                         reverse=True)[:args.worst]:
+        app.Console.PrintMessage(
+            '{standard} {diameter}x{length}: volume {volume:.2e}, area {area:.2e},'
+            ' faces {faces_real} -> {faces_swept}\n'.format(**result))
+    if compared:
+        app.Console.PrintMessage('max. volume difference {:.2e}, max. area difference {:.2e}\n'.format(
+            max(r['volume'] for r in compared), max(r['area'] for r in compared)))
+    for result in failed:
+        app.Console.PrintWarning('{standard} {diameter}x{length}: {0}\n'.format(
+            result.get('error', 'differs'), **result))
+    app.Console.PrintMessage('{} cases, {} failed, written to {}\n'.format(
+        len(results), len(failed), args.output))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()